@@ -16,6 +16,7 @@ from nltk.tokenize import word_tokenize
 from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
 from Sastrawi.StopWordRemover.StopWordRemoverFactory import StopWordRemoverFactory
 from dataclasses import dataclass, asdict
+from review_dedup import ReviewDeduplicator
 
 st.set_page_config(page_title="MapInsight Pro — Places & Reviews", layout="wide")
 
@@ -204,7 +205,8 @@ def scrape_search_results(query, city="", country="", lat="", lon="", limit=5):
     return results
 
 def scrape_reviews_with_ratings(url, num_reviews=30):
-    reviews_data = []
+    dedup = ReviewDeduplicator()
+    reviews_data = dedup.reviews
     seen_texts = set()
 
     BATCH_SIZE = 10
@@ -356,8 +358,8 @@ def scrape_reviews_with_ratings(url, num_reviews=30):
                         pass
 
                     seen_texts.add(text_content)
-                    reviews_data.append({"rating": rating_val, "text": text_content})
-                    new_in_batch += 1
+                    if dedup.add({"rating": rating_val, "text": text_content}):
+                        new_in_batch += 1
 
                 except:
                     continue
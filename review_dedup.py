@@ -0,0 +1,236 @@
+import math
+import re
+import zlib
+import numpy as np
+import pandas as pd
+
+# --- NEAR-DUPLICATE REVIEW DETECTION (MinHash + LSH) ---
+# Largest prime below 2^32: a * x + b stays under 2^64, and signatures fit in uint32
+_PRIME = 4294967291
+_TRUNCATION_MARKERS = ("...", "…")
+_ORIGINAL_MARKERS = ("(Original)", "(Asli)")
+
+def is_truncated(text):
+    return text.rstrip().endswith(_TRUNCATION_MARKERS)
+
+def is_translated(text):
+    return any(m in text for m in _ORIGINAL_MARKERS)
+
+def normalize_review_text(text):
+    # Google shows "(Translated by Google) ... (Original) ...": compare on the original part
+    for marker in _ORIGINAL_MARKERS:
+        if marker in text:
+            text = text.split(marker, 1)[1]
+            break
+    text = text.lower()
+    for m in _TRUNCATION_MARKERS:
+        text = text.replace(m, " ")
+    text = re.sub(r'[^\w\s]', '', text)
+    return re.sub(r'\s+', ' ', text).strip()
+
+def _get_rating(review):
+    # The scraper stores 0 when the star label could not be read
+    rating = review.get("rating")
+    if rating is None or (isinstance(rating, float) and math.isnan(rating)) or rating == 0:
+        return None
+    return rating
+
+def _index_add(index, key, slot):
+    # Most buckets hold a single review, so store a plain int until a second one arrives
+    current = index.get(key)
+    if current is None:
+        index[key] = slot
+    elif isinstance(current, int):
+        if current != slot:
+            index[key] = {current, slot}
+    else:
+        current.add(slot)
+
+def _index_get(index, key):
+    current = index.get(key)
+    if current is None:
+        return ()
+    if isinstance(current, int):
+        return (current,)
+    return current
+
+class ReviewDeduplicator:
+    """
+    Keeps one copy of each review, treating truncated, edited or translated copies as duplicates.
+    Candidates come from an LSH index over MinHash signatures (edited/translated copies) and
+    from an index of text prefixes (truncated copies), so each check is sub-linear.
+    Only reviews with the same rating are merged, and texts shorter than `min_fuzzy_length`
+    only merge when they are identical, since "Mantap" from two reviewers is two reviews.
+    When a duplicate is longer than the stored copy, it replaces it in place.
+    """
+
+    def __init__(self, threshold=0.8, num_perm=128, bands=16, shingle_size=5,
+                 prefix_size=40, min_fuzzy_length=20, seed=1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.prefix_size = prefix_size
+        self.min_fuzzy_length = min_fuzzy_length
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, _PRIME, size=num_perm, dtype=np.uint64)[:, None]
+        self._b = rng.randint(0, _PRIME, size=num_perm, dtype=np.uint64)[:, None]
+
+        self._buckets = [{} for _ in range(bands)]
+        self._prefixes = {}
+        self._exact = {}
+        self._signatures = []
+        self._texts = []
+        self._truncated = []
+        self._ratings = []
+        self.reviews = []
+
+    def __len__(self):
+        return len(self.reviews)
+
+    def _shingles(self, text):
+        k = self.shingle_size
+        return {text[i:i + k] for i in range(len(text) - k + 1)}
+
+    def _signature(self, shingles):
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) % _PRIME for s in shingles), dtype=np.uint64, count=len(shingles)
+        )
+        return ((self._a * hashes + self._b) % np.uint64(_PRIME)).min(axis=1).astype(np.uint32)
+
+    def _band_keys(self, signature):
+        # Key on the hash of each band: half the memory of the bytes, and a collision only
+        # adds a candidate that is verified anyway
+        r = self.rows
+        return [hash(signature[i * r:(i + 1) * r].tobytes()) for i in range(self.bands)]
+
+    def _is_prefix_copy(self, text, truncated, idx):
+        # Only a text that was visibly cut off (ends with "...") may match as a prefix of a longer one
+        other = self._texts[idx]
+        if truncated and len(text) <= len(other):
+            return other.startswith(text)
+        if self._truncated[idx] and len(other) <= len(text):
+            return text.startswith(other)
+        return False
+
+    def _same_rating(self, rating, idx):
+        other = self._ratings[idx]
+        return rating is None or other is None or rating == other
+
+    def _query(self, text, truncated, rating, signature, band_keys, prefix_key):
+        if prefix_key is not None:
+            for idx in _index_get(self._prefixes, prefix_key):
+                if self._same_rating(rating, idx) and self._is_prefix_copy(text, truncated, idx):
+                    return idx
+
+        candidates = set()
+        for bucket, key in zip(self._buckets, band_keys):
+            candidates.update(_index_get(bucket, key))
+
+        best, best_score = None, self.threshold
+        for idx in candidates:
+            if not self._same_rating(rating, idx):
+                continue
+            score = float(np.mean(signature == self._signatures[idx]))
+            if score >= best_score:
+                best, best_score = idx, score
+        return best
+
+    def _store(self, slot, review, text, truncated, rating, signature):
+        if slot == len(self.reviews):
+            self.reviews.append(review)
+            self._signatures.append(signature)
+            self._texts.append(text)
+            self._truncated.append(truncated)
+            self._ratings.append(rating)
+        else:
+            self.reviews[slot] = review
+            self._signatures[slot] = signature
+            self._texts[slot] = text
+            self._truncated[slot] = truncated
+            self._ratings[slot] = rating
+
+    def _is_better_copy(self, raw, text, slot):
+        # Compare on the normalized text, so a Google translation does not win on length alone
+        stored = self._texts[slot]
+        if len(text) != len(stored):
+            return len(text) > len(stored)
+        return is_translated(self.reviews[slot]["text"]) and not is_translated(raw)
+
+    def insert(self, review):
+        """
+        Adds a review dict with a "text" key. Returns (slot, is_new, replaced): the position
+        of the review in `reviews`, whether it is a new review, and whether it replaced a
+        shorter copy of itself.
+        """
+        raw = review.get("text")
+        slot = len(self.reviews)
+        if not isinstance(raw, str) or not raw.strip():
+            # Missing text: keep the row, but there is nothing to compare it on
+            self._store(slot, review, "", False, None, None)
+            return slot, True, False
+
+        rating = _get_rating(review)
+        text = normalize_review_text(raw)
+        if len(text) < self.min_fuzzy_length:
+            # Short texts ("Mantap", "👍👍") only merge with the exact same text and rating
+            key = raw.strip()
+            for idx in _index_get(self._exact, key):
+                if self._same_rating(rating, idx):
+                    return idx, False, False
+            self._store(slot, review, text, False, rating, None)
+            _index_add(self._exact, key, slot)
+            return slot, True, False
+
+        truncated = is_truncated(raw)
+        signature = self._signature(self._shingles(text))
+        band_keys = self._band_keys(signature)
+        prefix_key = text[:self.prefix_size] if len(text) >= self.prefix_size else None
+
+        dup = self._query(text, truncated, rating, signature, band_keys, prefix_key)
+        is_new = dup is None
+        replaced = False
+        if is_new:
+            self._store(slot, review, text, truncated, rating, signature)
+        else:
+            slot = dup
+            if self._is_better_copy(raw, text, slot):
+                self._store(slot, review, text, truncated, rating, signature)
+                replaced = True
+
+        # Index every version seen, so later copies can match either the short or the long one
+        for bucket, key in zip(self._buckets, band_keys):
+            _index_add(bucket, key, slot)
+        if prefix_key is not None:
+            _index_add(self._prefixes, prefix_key, slot)
+        return slot, is_new, replaced
+
+    def add(self, review):
+        """
+        Adds a review dict with a "text" key. Returns True if it is a new review,
+        False if it was merged into an existing one (keeping the longer text).
+        """
+        return self.insert(review)[1]
+
+def dedupe_reviews(reviews, **kwargs):
+    """
+    Cleanup pass over stored reviews (list of dicts or DataFrame with a 'text' column).
+    Returns the reviews with near-duplicates collapsed into their longest version.
+    """
+    is_frame = isinstance(reviews, pd.DataFrame)
+    records = reviews.to_dict("records") if is_frame else reviews
+    dedup = ReviewDeduplicator(**kwargs)
+    kept = []
+    for pos, review in enumerate(records):
+        slot, is_new, replaced = dedup.insert(review)
+        if is_new:
+            kept.append(pos)
+        elif replaced:
+            kept[slot] = pos
+    if is_frame:
+        return reviews.iloc[kept].copy()
+    return dedup.reviews
@@ -0,0 +1,135 @@
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from review_dedup import ReviewDeduplicator, dedupe_reviews
+
+FULL = (
+    "Tempatnya nyaman banget, kopi susu gula arennya enak dan harganya terjangkau. "
+    "Pelayanan ramah, parkiran luas, cocok buat nugas sampai malam. Recommended!"
+)
+INDO_VOCAB = (
+    "enak banget kopi susu nasi goreng ayam bakar tempat nyaman parkir luas harga murah mahal "
+    "pelayanan ramah lambat cepat bersih kotor suasana asik cocok nongkrong keluarga teman "
+    "porsi besar kecil rasa manis pedas gurih mantap recommended lagi datang"
+).split()
+
+
+def random_reviews(n, vocab, min_words, max_words, seed=0):
+    rng = random.Random(seed)
+    return [
+        {"rating": rng.randint(1, 5), "text": " ".join(rng.choices(vocab, k=rng.randint(min_words, max_words)))}
+        for _ in range(n)
+    ]
+
+
+def test_truncated_copy_keeps_full_text():
+    dedup = ReviewDeduplicator()
+    assert dedup.add({"rating": 5, "text": FULL[:90] + "..."})
+    assert not dedup.add({"rating": 5, "text": FULL})
+    assert not dedup.add({"rating": 5, "text": FULL[:120] + "…"})
+    assert [r["text"] for r in dedup.reviews] == [FULL]
+
+
+def test_translated_and_edited_copies_merge():
+    dedup = ReviewDeduplicator()
+    assert dedup.add({"rating": 5, "text": FULL})
+    assert not dedup.add({"rating": 5, "text": "(Translated by Google) Comfortable place, good coffee.\n\n(Original)\n" + FULL})
+    assert not dedup.add({"rating": 5, "text": FULL.replace("Recommended!", "Recommended!!")})
+    assert len(dedup) == 1
+
+
+def test_unrelated_short_and_long_reviews_are_kept():
+    short = {"rating": 5, "text": "Kopi susu enak banget, tempat nyaman"}
+    long = {"rating": 4, "text": FULL + " Kopi susu enak banget, tempat nyaman, pasti datang lagi bareng keluarga."}
+    assert len(dedupe_reviews([long, short])) == 2
+
+    reviews = random_reviews(2000, INDO_VOCAB, 10, 150)
+    assert len(dedupe_reviews(reviews)) == len(reviews)
+
+
+def test_emoji_only_reviews_are_kept():
+    reviews = [{"rating": 5, "text": "👍👍"}, {"rating": 1, "text": "!!!"}, {"rating": 5, "text": FULL}]
+    assert dedupe_reviews(reviews) == reviews
+
+
+def test_missing_text_passes_through():
+    reviews = [{"rating": 3, "text": float("nan")}, {"rating": 2, "text": None}, {"rating": 5, "text": ""}]
+    assert dedupe_reviews(reviews) == reviews
+
+
+def test_dataframe_keeps_index_of_longest_copy():
+    df = pd.DataFrame(
+        {"rating": [5, 4, 5, 3], "text": [FULL[:90] + "...", "Parkir susah", FULL, float("nan")]},
+        index=[10, 11, 12, 13],
+    )
+    out = dedupe_reviews(df)
+    assert list(out.index) == [12, 11, 13]
+    assert out.loc[12, "text"] == FULL
+
+
+def test_short_reviews_from_different_reviewers_are_kept():
+    reviews = [
+        {"rating": 5, "text": "Mantap"},
+        {"rating": 1, "text": "mantap!"},
+        {"rating": 5, "text": "MANTAP!!!"},
+        {"rating": 4, "text": "Enak banget"},
+        {"rating": 4, "text": "Enak banget."},
+    ]
+    assert dedupe_reviews(reviews) == reviews
+    assert len(dedupe_reviews(reviews + [{"rating": 5, "text": "Mantap"}])) == len(reviews)
+
+
+def test_copies_with_different_ratings_are_kept():
+    reviews = [{"rating": 5, "text": FULL}, {"rating": 2, "text": FULL[:90] + "..."}, {"rating": 1, "text": FULL + "!"}]
+    assert dedupe_reviews(reviews) == reviews
+
+
+def test_ellipsis_inside_text_is_not_truncation():
+    first = {"rating": 4, "text": "Tempatnya nyaman banget, makanannya enak... pokoknya mantap"}
+    second = {"rating": 4, "text": first["text"] + ", tapi parkirnya susah ... kecewa"}
+    assert dedupe_reviews([first, second]) == [first, second]
+
+
+def test_untranslated_copy_is_kept_over_translation():
+    original = {"rating": 5, "text": FULL}
+    translated = {
+        "rating": 5,
+        "text": "(Translated by Google) Very comfortable place, the palm sugar coffee is good.\n\n(Original)\n" + FULL,
+    }
+    assert dedupe_reviews([original, translated]) == [original]
+    assert dedupe_reviews([translated, original]) == [original]
+
+
+def test_dataframe_result_is_a_copy():
+    df = pd.DataFrame({"rating": [5, 5], "text": [FULL[:90] + "...", FULL]})
+    out = dedupe_reviews(df)
+    out["text"] = out["text"].str.upper()
+    assert df.loc[1, "text"] == FULL
+
+
+def test_many_unique_reviews_are_kept():
+    rng = random.Random(1)
+    vocab = ["".join(rng.choices("abcdefghijklmnoprstuwy", k=rng.randint(3, 9))) for _ in range(5000)]
+    reviews = random_reviews(5000, vocab, 10, 120, seed=2)
+    assert len(dedupe_reviews(reviews)) == len(reviews)
+
+
+@pytest.mark.skipif(not os.environ.get("RUN_BENCHMARKS"), reason="set RUN_BENCHMARKS=1 to run")
+def test_benchmark_100k_reviews():
+    rng = random.Random(3)
+    vocab = ["".join(rng.choices("abcdefghijklmnoprstuwy", k=rng.randint(3, 9))) for _ in range(5000)]
+    reviews = random_reviews(100000, vocab, 10, 120, seed=4)
+    truncated = [{"rating": r["rating"], "text": r["text"][:len(r["text"]) * 2 // 3] + "..."}
+                 for r in reviews[:10000] if len(r["text"]) > 100]
+
+    start = time.perf_counter()
+    kept = dedupe_reviews(reviews + truncated)
+    print(f"\n{len(reviews) + len(truncated)} reviews -> {len(kept)} in {time.perf_counter() - start:.1f}s")
+    assert len(kept) == len(reviews)